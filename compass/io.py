@@ -1,12 +1,28 @@
+import json
 import os
 import tempfile
+import threading
 import requests
 import progressbar
 from urllib.parse import urlparse
 import importlib.resources
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 
-def download(url, dest_path, config, exceptions=True):
+# a session shared between downloads so connections to the server can be
+# reused rather than re-established for each file
+_session = None
+
+# the name of the manifest of downloaded files in each database directory
+_manifest_filename = '.compass_manifest.json'
+
+# guards manifest updates from downloads running in different threads
+_manifest_lock = threading.Lock()
+
+
+def download(url, dest_path, config, exceptions=True,  # noqa: C901
+             show_progress=True, cancel_event=None):
     """
     Download a file from a URL to the given path or path name
 
@@ -26,6 +42,14 @@ def download(url, dest_path, config, exceptions=True):
     exceptions : bool, optional
         Whether to raise exceptions when the download fails
 
+    show_progress : bool, optional
+        Whether to display a progress bar.  This should be ``False`` when
+        several files are being downloaded at once
+
+    cancel_event : threading.Event, optional
+        An event that, once set, stops the download (removing the partially
+        downloaded file) by raising an ``InterruptedError``
+
     Returns
     -------
     dest_path : str
@@ -39,6 +63,7 @@ def download(url, dest_path, config, exceptions=True):
     do_download = config.getboolean('download', 'download')
     check_size = config.getboolean('download', 'check_size')
     verify = config.getboolean('download', 'verify')
+    trust_cache = config.getboolean('download', 'trust_cache')
 
     if not do_download:
         if not os.path.exists(dest_path):
@@ -49,20 +74,20 @@ def download(url, dest_path, config, exceptions=True):
     if not check_size and os.path.exists(dest_path):
         return dest_path
 
-    session = requests.Session()
-    if not verify:
-        session.verify = False
+    if trust_cache and _in_manifest(dest_path):
+        # the file hasn't changed since we last checked it against the server
+        return dest_path
+
+    session = _get_session()
 
     # dest_path contains full path, so we need to make the relevant
     # subdirectories if they do not exist already
     directory = os.path.dirname(dest_path)
-    try:
-        os.makedirs(directory)
-    except OSError:
-        pass
+    os.makedirs(directory, exist_ok=True)
 
     try:
-        response = session.get(url, stream=True)
+        response = session.get(url, stream=True, verify=verify,
+                               timeout=(5, 60))
         total_size = response.headers.get('content-length')
     except requests.exceptions.RequestException:
         if exceptions:
@@ -105,6 +130,8 @@ def download(url, dest_path, config, exceptions=True):
         if os.path.exists(dest_path) and \
                 total_size == os.path.getsize(dest_path):
             # we already have the file, so just return
+            if trust_cache:
+                _update_manifest(dest_path)
             return dest_path
 
         if out_file_name == in_file_name:
@@ -114,26 +141,43 @@ def download(url, dest_path, config, exceptions=True):
         dest_dir = os.path.dirname(dest_path)
         print(f'Downloading {file_names} ({_sizeof_fmt(total_size)})\n'
               f'  to {dest_dir}')
-        widgets = [progressbar.Percentage(), ' ', progressbar.Bar(),
-                   ' ', progressbar.ETA()]
-        bar = progressbar.ProgressBar(widgets=widgets,
-                                      max_value=total_size).start()
+        if show_progress:
+            widgets = [progressbar.Percentage(), ' ', progressbar.Bar(),
+                       ' ', progressbar.ETA()]
+            bar = progressbar.ProgressBar(widgets=widgets,
+                                          max_value=total_size).start()
+        else:
+            bar = None
         size = 0
-        with open(dest_path, 'wb') as f:
-            try:
-                for data in response.iter_content(chunk_size=4096):
-                    size += len(data)
-                    f.write(data)
-                    bar.update(size)
-                bar.finish()
-            except requests.exceptions.RequestException:
-                if exceptions:
-                    raise
+        try:
+            with open(dest_path, 'wb') as f:
+                try:
+                    for data in response.iter_content(chunk_size=1024**2):
+                        if cancel_event is not None and cancel_event.is_set():
+                            raise InterruptedError(
+                                f'Download of {in_file_name} was cancelled')
+                        size += len(data)
+                        f.write(data)
+                        if bar is not None:
+                            bar.update(size)
+                    if bar is not None:
+                        bar.finish()
+                except requests.exceptions.RequestException:
+                    if exceptions:
+                        raise
+                    else:
+                        print(f'  {in_file_name} failed!')
+                        return None
                 else:
-                    print(f'  {in_file_name} failed!')
-                    return None
-            else:
-                print(f'  {in_file_name} done.')
+                    print(f'  {in_file_name} done.')
+        except InterruptedError:
+            # don't leave behind a partial file that could later be mistaken
+            # for a complete one
+            os.remove(dest_path)
+            raise
+
+    if trust_cache:
+        _update_manifest(dest_path)
     return dest_path
 
 
@@ -142,6 +186,7 @@ def symlink(target, link_name, overwrite=True):
     From https://stackoverflow.com/a/55742015/7728169
     Create a symbolic link named link_name pointing to target.
     If link_name exists then FileExistsError is raised, unless overwrite=True.
+    If link_name is already a symlink to target, it is left as it is.
     When trying to overwrite a directory, IsADirectoryError is raised.
 
     Parameters
@@ -160,6 +205,15 @@ def symlink(target, link_name, overwrite=True):
         os.symlink(target, link_name)
         return
 
+    # nothing to do if the link already points to the target (e.g. if a test
+    # case is being set up again)
+    try:
+        if os.readlink(link_name) == target:
+            return
+    except OSError:
+        # the link doesn't exist or isn't a symlink
+        pass
+
     # os.replace() may fail if files are on different filesystems
     link_dir = os.path.dirname(link_name)
 
@@ -209,6 +263,86 @@ def package_path(package, resource):
         importlib.resources.files(package) / file_name)
 
 
+def _get_manifest_filename(dest_path):
+    """
+    Get the name of the manifest file in the same directory as a download
+    """
+    return os.path.join(os.path.dirname(dest_path), _manifest_filename)
+
+
+def _read_manifest(manifest_filename):
+    """
+    Read a manifest of downloaded files, returning an empty manifest if the
+    file doesn't exist or can't be parsed
+    """
+    try:
+        with open(manifest_filename) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return dict()
+
+
+def _in_manifest(dest_path):
+    """
+    Whether a downloaded file exists and has the same size and modification
+    time as when it was added to the manifest
+    """
+    try:
+        file_stat = os.stat(dest_path)
+    except OSError:
+        return False
+    manifest = _read_manifest(_get_manifest_filename(dest_path))
+    entry = manifest.get(os.path.basename(dest_path))
+    return entry is not None and entry['size'] == file_stat.st_size and \
+        entry['mtime'] == file_stat.st_mtime
+
+
+def _update_manifest(dest_path):
+    """
+    Add a downloaded file to the manifest in its directory.  The manifest is
+    only an optimization, so failing to update it (e.g. because the database
+    is read-only for this user) is not an error
+    """
+    manifest_filename = _get_manifest_filename(dest_path)
+    try:
+        file_stat = os.stat(dest_path)
+        with _manifest_lock:
+            manifest = _read_manifest(manifest_filename)
+            manifest[os.path.basename(dest_path)] = {
+                'size': file_stat.st_size, 'mtime': file_stat.st_mtime}
+            # write to a temporary file and then move it so other processes
+            # never see a partially written manifest
+            fd, temp_filename = tempfile.mkstemp(
+                dir=os.path.dirname(manifest_filename))
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(manifest, f, indent=1)
+                # mkstemp() makes the file private, but databases are shared
+                os.chmod(temp_filename, 0o664)
+                os.replace(temp_filename, manifest_filename)
+            except BaseException:
+                if os.path.exists(temp_filename):
+                    os.remove(temp_filename)
+                raise
+    except OSError as e:
+        print(f'Warning: could not update {manifest_filename}: {e}')
+
+
+def _get_session():
+    """
+    Get the shared session for downloads, creating it if needed
+    """
+    global _session
+    if _session is None:
+        retry = Retry(total=3, backoff_factor=0.5)
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16,
+                              max_retries=retry)
+        _session = requests.Session()
+        _session.mount('https://', adapter)
+        _session.mount('http://', adapter)
+    return _session
+
+
 # From https://stackoverflow.com/a/1094933/7728169
 def _sizeof_fmt(num, suffix='B'):
     """
@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 from importlib import resources
 
 import numpy as np
@@ -90,8 +91,7 @@ def write_job_script(config, machine, target_cores, min_cores, work_dir,
             job_name = f'compass_{suite}'
     wall_time = config.get('job', 'wall_time')
 
-    template = Template(resources.read_text(
-        'compass.job', 'job_script.template'))
+    template = _get_job_script_template()
 
     text = template.render(job_name=job_name, account=account,
                            nodes=f'{nodes}', wall_time=wall_time, qos=qos,
@@ -130,3 +130,12 @@ def _clean_up_whitespace(text):
     lines.extend([trimmed[-1], ''])
     text = '\n'.join(lines)
     return text
+
+
+@lru_cache(maxsize=None)
+def _get_job_script_template():
+    """
+    Read and compile the job script template, which only needs to be done
+    once even when job scripts are written for many test cases
+    """
+    return Template(resources.read_text('compass.job', 'job_script.template'))
@@ -1,11 +1,8 @@
 import xarray
-import xarray.plot
 import numpy as np
-import matplotlib.pyplot as plt
-import cartopy.crs as ccrs
-import cartopy
 import jigsawpy
 from jigsawpy.savejig import savejig
+from netCDF4 import Dataset
 
 from mpas_tools.cime.constants import constants
 from mpas_tools.mesh.conversion import convert
@@ -13,7 +10,6 @@ from mpas_tools.mesh.creation.jigsaw_to_netcdf import jigsaw_to_netcdf
 from mpas_tools.ocean.inject_meshDensity import inject_spherical_meshDensity
 from mpas_tools.io import write_netcdf
 from mpas_tools.logging import check_call
-from mpas_tools.viz.colormaps import register_sci_viz_colormaps
 from mpas_tools.viz.paraview_extractor import extract_vtk
 
 from compass.step import Step
@@ -28,6 +24,11 @@ class SphericalBaseStep(Step):
     ----------
     opts : jigsawpy.jigsaw_jig_t
         JIGSAW options for creating the mesh
+
+    cell_width_lat_lon : tuple of numpy.ndarray
+        The cell width, longitude and latitude saved by
+        ``save_and_plot_cell_width()``, kept in memory so they don't need to
+        be read back from ``cell_width_filename``
     """
     def __init__(self, test_case, name, subdir):
         """
@@ -49,6 +50,8 @@ class SphericalBaseStep(Step):
         # setup files for JIGSAW
         self.opts = jigsawpy.jigsaw_jig_t()
 
+        self.cell_width_lat_lon = None
+
     def save_and_plot_cell_width(self, lon, lat, cell_width):
         """
         Save the cell width field on a lon/lat grid to
@@ -66,11 +69,21 @@ class SphericalBaseStep(Step):
             m x n array of cell width in km
         """
         section = self.config['spherical_mesh']
-        da = xarray.DataArray(
-            cell_width, dims=['lat', 'lon'], coords={'lat': lat, 'lon': lon},
-            name='cellWidth')
         cell_width_filename = section.get('cell_width_filename')
-        da.to_netcdf(cell_width_filename)
+        # write directly with netCDF4, rather than going through xarray's
+        # encoding machinery for a single 2D array
+        with Dataset(cell_width_filename, 'w', format='NETCDF4') as ds:
+            ds.createDimension('lat', lat.size)
+            ds.createDimension('lon', lon.size)
+            lat_var = ds.createVariable('lat', 'f8', ('lat',))
+            lon_var = ds.createVariable('lon', 'f8', ('lon',))
+            cell_width_var = ds.createVariable('cellWidth', 'f8',
+                                               ('lat', 'lon'))
+            lat_var[:] = lat
+            lon_var[:] = lon
+            cell_width_var[:] = cell_width
+
+        self.cell_width_lat_lon = (cell_width, lon, lat)
 
         if section.getboolean('plot_cell_width'):
             self._plot_cell_width(cell_width)
@@ -109,10 +122,19 @@ class SphericalBaseStep(Step):
 
         if section.getboolean('add_mesh_density'):
             logger.info(f'Add meshDensity into the mesh file')
-            ds = xarray.open_dataset('cellWidthVsLatLon.nc')
+            if self.cell_width_lat_lon is None:
+                ds = xarray.open_dataset(section.get('cell_width_filename'))
+                cell_width = ds.cellWidth.values
+                lon = ds.lon.values
+                lat = ds.lat.values
+            else:
+                cell_width, lon, lat = self.cell_width_lat_lon
             inject_spherical_meshDensity(
-                ds.cellWidth.values, ds.lon.values, ds.lat.values,
-                mesh_filename=mpas_mesh_filename)
+                cell_width, lon, lat, mesh_filename=mpas_mesh_filename)
+
+        # the cell width may be large and the step object may stay around for
+        # the rest of a test suite, so we don't hold onto it any longer
+        self.cell_width_lat_lon = None
 
         if section.getboolean('convert_to_vtk'):
             vtk_dir = section.get('vtk_dir')
@@ -139,12 +161,20 @@ class SphericalBaseStep(Step):
         cell_width : numpy.ndarray
             m x n array of cell width in km
         """
+        # these are slow to import and only needed for plotting, so we
+        # import them here rather than whenever test cases are listed
+        import cartopy
+        import cartopy.crs as ccrs
+        import matplotlib.pyplot as plt
+        from mpas_tools.viz.colormaps import register_sci_viz_colormaps
+
         config = self.config
         cmap = config.get('spherical_mesh', 'cell_width_colormap')
         image_filename = config.get('spherical_mesh',
                                     'cell_width_image_filename')
+        dpi = config.getint('spherical_mesh', 'cell_width_image_dpi')
         register_sci_viz_colormaps()
-        fig = plt.figure(figsize=[16.0, 8.0])
+        plt.figure(figsize=[16.0, 8.0], dpi=dpi)
         ax = plt.axes(projection=ccrs.PlateCarree())
         ax.set_global()
         im = ax.imshow(cell_width, origin='lower',
@@ -165,7 +195,6 @@ class SphericalBaseStep(Step):
         plt.title(
             f'Grid cell size, km, min: {min_width:.1f} max: {max_width:.1f}')
         plt.colorbar(im, shrink=.60)
-        fig.canvas.draw()
         plt.tight_layout()
         plt.savefig(image_filename, bbox_inches='tight')
         plt.close()
@@ -68,10 +68,14 @@ def replace(namelist, replacements):
 def write(namelist, filename):
     """ Write the namelist out """
 
+    lines = list()
+    for record in namelist:
+        lines.append('&{}'.format(record))
+        rec = namelist[record]
+        for key in rec:
+            lines.append('    {} = {}'.format(key.strip(), rec[key].strip()))
+        lines.append('/')
+
+    # write the whole namelist at once
     with open(filename, 'w') as f:
-        for record in namelist:
-            f.write('&{}\n'.format(record))
-            rec = namelist[record]
-            for key in rec:
-                f.write('    {} = {}\n'.format(key.strip(), rec[key].strip()))
-            f.write('/\n')
+        f.write(''.join(f'{line}\n' for line in lines))
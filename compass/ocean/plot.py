@@ -5,9 +5,11 @@ import datetime
 import matplotlib.pyplot as plt
 from matplotlib.font_manager import FontProperties
 
+from compass.ocean.vertical.grid_1d import get_1d_grid_depths
+
 
 def plot_initial_state(input_file_name='initial_state.nc',
-                       output_file_name='initial_state.png'):
+                       output_file_name='initial_state.png', dpi=None):
     """
     creates histogram plots of the initial condition
 
@@ -18,6 +20,10 @@ def plot_initial_state(input_file_name='initial_state.nc',
 
     output_file_name: str, optional
         The path to the output image file
+
+    dpi : int, optional
+        The resolution of the output image in dots per inch, matplotlib's
+        default if not provided
     """
 
     # load mesh variables
@@ -119,11 +125,14 @@ def plot_initial_state(input_file_name='initial_state.nc',
 
     plt.tight_layout(pad=4.0)
 
-    plt.savefig(output_file_name, bbox_inches='tight', pad_inches=0.1)
+    plt.savefig(output_file_name, bbox_inches='tight', pad_inches=0.1,
+                dpi=dpi)
+    plt.close(fig)
 
 
 def plot_vertical_grid(grid_filename, config,
-                       out_filename='vertical_grid.png'):
+                       out_filename='vertical_grid.png', dpi=None,
+                       interfaces=None):
     """
     Plot the vertical grid
 
@@ -137,13 +146,25 @@ def plot_vertical_grid(grid_filename, config,
 
     out_filename : str, optional
         The name of the image file to write to
+
+    dpi : int, optional
+        The resolution of the output image in dots per inch, matplotlib's
+        default if not provided
+
+    interfaces : numpy.ndarray, optional
+        A 1D array of positive depths for layer interfaces in meters.  If
+        provided, the grid is computed from these rather than being read from
+        ``grid_filename``
     """
 
-    ds = xarray.open_dataset(grid_filename)
-    nVertLevels = ds.sizes['nVertLevels']
-    midDepth = ds.refMidDepth.values
-    layerThickness = ds.refLayerThickness.values
-    botDepth = ds.refBottomDepth.values
+    if interfaces is None:
+        ds = xarray.open_dataset(grid_filename)
+        midDepth = ds.refMidDepth.values
+        layerThickness = ds.refLayerThickness.values
+        botDepth = ds.refBottomDepth.values
+    else:
+        botDepth, midDepth, layerThickness = get_1d_grid_depths(interfaces)
+    nVertLevels = len(botDepth)
 
     fig = plt.figure()
     fig.set_size_inches(16.0, 8.0)
@@ -199,4 +220,5 @@ def plot_vertical_grid(grid_filename, config,
     plt.subplot(2, 2, 4)
     plt.text(0, 0, txt, fontsize=12)
     plt.axis('off')
-    plt.savefig(out_filename)
+    plt.savefig(out_filename, dpi=dpi)
+    plt.close(fig)
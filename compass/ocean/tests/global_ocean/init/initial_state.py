@@ -156,7 +156,8 @@ class InitialState(Step):
 
         write_1d_grid(interfaces=interfaces, out_filename='vertical_grid.nc')
         plot_vertical_grid(grid_filename='vertical_grid.nc', config=config,
-                           out_filename='vertical_grid.png')
+                           out_filename='vertical_grid.png', dpi=90,
+                           interfaces=interfaces)
 
         run_model(self)
 
@@ -164,7 +165,7 @@ class InitialState(Step):
                                    init_filename='initial_state.nc')
 
         plot_initial_state(input_file_name='initial_state.nc',
-                           output_file_name='initial_state.png')
+                           output_file_name='initial_state.png', dpi=90)
 
     def _get_resources(self):
         # get the these properties from the config options
@@ -157,7 +157,6 @@ class Mesh(TestCase):
                        f'{approx_cell_count}')
 
         config.set('spherical_mesh', 'add_mesh_density', 'True')
-        config.set('spherical_mesh', 'plot_cell_width', 'True')
         if self.with_ice_shelf_cavities:
             prefix = config.get('global_ocean', 'prefix')
             config.set('global_ocean', 'prefix', f'{prefix}wISC')
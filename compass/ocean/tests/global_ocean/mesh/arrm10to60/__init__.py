@@ -124,7 +124,6 @@ class ARRM10to60BaseMesh(QuasiUniformSphericalMeshStep):
         for var_name in var_names:
             _plot_cartopy(j, var_name, vars()[var_name], '3Wbgy5')
             j += 1
-        fig.canvas.draw()
         plt.tight_layout()
 
         plt.savefig('mesh_construction.png')
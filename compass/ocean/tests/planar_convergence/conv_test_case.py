@@ -99,8 +99,14 @@ class ConvTestCase(TestCase):
 
         self.resolutions = resolutions
 
+        # the init steps are independent, serial python steps, so they can
+        # all run at the same time before the forward runs
+        for resolution in resolutions:
+            init = self.create_init(resolution=resolution)
+            init.parallel_group = 'init'
+            self.add_step(init)
+
         for resolution in resolutions:
-            self.add_step(self.create_init(resolution=resolution))
             self.add_step(Forward(test_case=self, resolution=resolution))
 
         self.add_step(self.create_analysis(resolutions=resolutions))
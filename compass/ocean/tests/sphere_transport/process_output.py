@@ -268,11 +268,7 @@ def read_ncl_rgb_file(cmap_filename):
         pass
     if map_file_found:
         ncolors = int(flines[0].split()[-1])
-        rgb = np.zeros((ncolors, 3))
-        for i, l in enumerate(flines[3:]):
-            ls = l.split()
-            for j in range(3):
-                rgb[i, j] = ls[j]
+        rgb = np.loadtxt(flines[3:3 + ncolors], usecols=(0, 1, 2), ndmin=2)
         rgb /= 255
         result = ListedColormap(rgb, name=cmap_filename)
     else:
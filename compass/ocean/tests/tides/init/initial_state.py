@@ -106,7 +106,8 @@ class InitialState(Step):
 
         write_1d_grid(interfaces=interfaces, out_filename='vertical_grid.nc')
         plot_vertical_grid(grid_filename='vertical_grid.nc', config=config,
-                           out_filename='vertical_grid.png')
+                           out_filename='vertical_grid.png',
+                           interfaces=interfaces)
 
         run_model(self)
 
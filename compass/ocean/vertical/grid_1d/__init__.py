@@ -96,15 +96,41 @@ def write_1d_grid(interfaces, out_filename):
     refLayerThickness = ncfile.createVariable(
         'refLayerThickness', np.dtype('float64').char, ('nVertLevels',))
 
-    botDepth = interfaces[1:]
-    midDepth = 0.5 * (interfaces[0:-1] + interfaces[1:])
+    botDepth, midDepth, layerThickness = get_1d_grid_depths(interfaces)
 
     refBottomDepth[:] = botDepth
     refMidDepth[:] = midDepth
-    refLayerThickness[:] = interfaces[1:] - interfaces[0:-1]
+    refLayerThickness[:] = layerThickness
     ncfile.close()
 
 
+def get_1d_grid_depths(interfaces):
+    """
+    Get the reference bottom depth, mid-depth and layer thickness of each
+    level of a vertical grid, as written out by ``write_1d_grid()``
+
+    Parameters
+    ----------
+    interfaces : numpy.ndarray
+        A 1D array of positive depths for layer interfaces in meters
+
+    Returns
+    -------
+    bottom_depth : numpy.ndarray
+        The positive-down depth of the bottom of each level
+
+    mid_depth : numpy.ndarray
+        The positive-down depth of the middle of each level
+
+    layer_thickness : numpy.ndarray
+        The thickness of each level
+    """
+    bottom_depth = interfaces[1:]
+    mid_depth = 0.5 * (interfaces[0:-1] + interfaces[1:])
+    layer_thickness = interfaces[1:] - interfaces[0:-1]
+    return bottom_depth, mid_depth, layer_thickness
+
+
 def add_1d_grid(config, ds):
     """
     Add a 1D vertical grid based on the config options in the ``vertical_grid``
@@ -5,6 +5,8 @@ import os
 import pickle
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import ExitStack
 
 import mpas_tools.io
 from mpas_tools.logging import LoggingContext, check_call
@@ -69,10 +71,7 @@ def run_tests(suite_name, quiet=False, is_test_case=False, steps_to_run=None,
         os.environ['PYTHONUNBUFFERED'] = '1'
 
         if not is_test_case:
-            try:
-                os.makedirs('case_outputs')
-            except OSError:
-                pass
+            os.makedirs('case_outputs', exist_ok=True)
 
         failures = 0
         cwd = os.getcwd()
@@ -398,28 +397,43 @@ def _run_test(test_case, available_resources):
     """
     logger = test_case.logger
     cwd = os.getcwd()
-    for step_name in test_case.steps_to_run:
-        step = test_case.steps[step_name]
-        if step.cached:
-            logger.info(f'  * Cached step: {step_name}')
-            continue
-        step.config = test_case.config
-        if test_case.log_filename is not None:
-            step.log_filename = test_case.log_filename
+    for step_names in _get_step_groups(test_case):
+        steps = list()
+        for step_name in step_names:
+            step = test_case.steps[step_name]
+            if step.cached:
+                logger.info(f'  * Cached step: {step_name}')
+                continue
+            step.config = test_case.config
+            if test_case.log_filename is not None:
+                step.log_filename = test_case.log_filename
+            steps.append(step)
+
+        if len(steps) > 1:
+            if _steps_fit_in_parallel(steps, available_resources):
+                for step in steps:
+                    _print_to_stdout(test_case, f'  * step: {step.name}')
+                _run_steps_in_parallel(test_case, steps,
+                                       test_case.new_step_log_file)
+                continue
+            logger.info(f'  Not enough cores to run steps in parallel '
+                        f'group "{steps[0].parallel_group}" at the same '
+                        f'time, so running them one at a time')
+
+        for step in steps:
+            _print_to_stdout(test_case, f'  * step: {step.name}')
 
-        _print_to_stdout(test_case, f'  * step: {step_name}')
-
-        try:
-            if step.run_as_subprocess:
-                _run_step_as_subprocess(
-                    test_case, step, test_case.new_step_log_file)
-            else:
-                _run_step(test_case, step, test_case.new_step_log_file,
-                          available_resources)
-        except BaseException:
-            _print_to_stdout(test_case, '      Failed')
-            raise
-        os.chdir(cwd)
+            try:
+                if step.run_as_subprocess:
+                    _run_step_as_subprocess(
+                        test_case, step, test_case.new_step_log_file)
+                else:
+                    _run_step(test_case, step, test_case.new_step_log_file,
+                              available_resources)
+            except BaseException:
+                _print_to_stdout(test_case, '      Failed')
+                raise
+            os.chdir(cwd)
 
 
 def _run_step(test_case, step, new_log_file, available_resources):
@@ -430,16 +444,7 @@ def _run_step(test_case, step, new_log_file, available_resources):
     cwd = os.getcwd()
     step.constrain_resources(available_resources)
 
-    missing_files = list()
-    for input_file in step.inputs:
-        if not os.path.exists(input_file):
-            missing_files.append(input_file)
-
-    if len(missing_files) > 0:
-        raise OSError(
-            f'input file(s) missing in step {step.name} of '
-            f'{step.mpas_core.name}/{step.test_group.name}/'
-            f'{step.test_case.subdir}: {missing_files}')
+    _check_files_exist(step, step.inputs, 'input')
 
     test_name = step.path.replace('/', '_')
     if new_log_file:
@@ -467,18 +472,135 @@ def _run_step(test_case, step, new_log_file, available_resources):
         step_logger.info('')
         step.run()
 
-    missing_files = list()
-    for output_file in step.outputs:
-        if not os.path.exists(output_file):
-            missing_files.append(output_file)
+    _check_files_exist(step, step.outputs, 'output')
+
+
+def _check_files_exist(step, paths, kind):
+    """
+    Raise an error if any of the input or output files of a step are missing
+    """
+    missing_files = _find_missing(paths)
 
     if len(missing_files) > 0:
         raise OSError(
-            f'output file(s) missing in step {step.name} of '
+            f'{kind} file(s) missing in step {step.name} of '
             f'{step.mpas_core.name}/{step.test_group.name}/'
             f'{step.test_case.subdir}: {missing_files}')
 
 
+def _find_missing(paths):
+    """
+    Find the paths that don't exist, listing a directory once rather than
+    calling ``os.path.exists()`` on each path when it holds several of them
+    """
+    paths_by_dir = dict()
+    for path in paths:
+        directory, name = os.path.split(path)
+        paths_by_dir.setdefault(directory, list()).append((path, name))
+
+    found = set()
+    for directory, dir_paths in paths_by_dir.items():
+        entries = None
+        # listing a large directory (e.g. a database) costs more than a few
+        # stat() calls, so only do it for directories with several paths
+        if len(dir_paths) >= 4:
+            try:
+                with os.scandir(directory if directory else '.') as it:
+                    entries = {entry.name: entry for entry in it}
+            except OSError:
+                # the directory doesn't exist (or can't be listed)
+                pass
+
+        for path, name in dir_paths:
+            if entries is not None and name in entries:
+                entry = entries[name]
+                # for symlinks, these follow the link (like os.path.exists)
+                exists = entry.is_file() or entry.is_dir() or \
+                    os.path.exists(path)
+            else:
+                # also covers paths with a trailing slash
+                exists = os.path.exists(path)
+            if exists:
+                found.add(path)
+
+    return [path for path in paths if path not in found]
+
+
+def _get_step_groups(test_case):
+    """
+    Group consecutive steps to run that share a ``parallel_group``.  Steps
+    without a group are in a group of their own.
+    """
+    groups = list()
+    previous_group = None
+    for step_name in test_case.steps_to_run:
+        # steps pickled by older versions of compass have no parallel_group
+        group = getattr(test_case.steps[step_name], 'parallel_group', None)
+        if group is not None and group == previous_group:
+            groups[-1].append(step_name)
+        else:
+            groups.append([step_name])
+        previous_group = group
+    return groups
+
+
+def _steps_fit_in_parallel(steps, available_resources):
+    """
+    Whether the steps can all run at the same time without oversubscribing
+    the available cores
+    """
+    cores = sum([step.ntasks * step.cpus_per_task for step in steps])
+    return cores <= available_resources['cores']
+
+
+def _run_steps_in_parallel(test_case, steps, new_log_file):
+    """
+    Run the requested steps at the same time, each as a subprocess
+    """
+    logger = test_case.logger
+    cwd = os.getcwd()
+    max_workers = test_case.config.getint('parallel', 'max_step_workers')
+    max_workers = max(1, min(max_workers, len(steps)))
+
+    with ExitStack() as stack:
+        step_loggers = list()
+        for step in steps:
+            test_name = step.path.replace('/', '_')
+            if new_log_file:
+                log_filename = f'{cwd}/{step.name}.log'
+                step.log_filename = log_filename
+                step_logger = None
+            else:
+                step_logger = logger
+                log_filename = None
+            step_logger = stack.enter_context(LoggingContext(
+                name=test_name, logger=step_logger,
+                log_filename=log_filename))
+            step_loggers.append(step_logger)
+
+        step_args = ['compass', 'run', '--step_is_subprocess']
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(check_call, step_args, step_logger,
+                                       cwd=step.work_dir)
+                       for step, step_logger in zip(steps, step_loggers)]
+            # wait for all the steps to finish before raising any errors
+            wait(futures)
+
+        failed = list()
+        for step, step_logger, future in zip(steps, step_loggers, futures):
+            try:
+                future.result()
+            except BaseException as e:
+                step_logger.error(f'Step {step.name} failed: {e}')
+                _print_to_stdout(test_case, f'      Failed: {step.name}')
+                failed.append(step.name)
+
+    if len(failed) > 0:
+        raise OSError(
+            f'step(s) failed in parallel group {steps[0].parallel_group} of '
+            f'{test_case.path}: {failed}')
+
+
 def _run_step_as_subprocess(test_case, step, new_log_file):
     """
     Run the requested step as a subprocess
@@ -496,9 +618,8 @@ def _run_step_as_subprocess(test_case, step, new_log_file):
     with LoggingContext(name=test_name, logger=step_logger,
                         log_filename=log_filename) as step_logger:
 
-        os.chdir(step.work_dir)
         step_args = ['compass', 'run', '--step_is_subprocess']
-        check_call(step_args, step_logger)
+        check_call(step_args, step_logger, cwd=step.work_dir)
 
 
 def _test_case_run_deprecated(test_case):
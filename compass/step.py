@@ -3,6 +3,10 @@ import json
 import os
 import shutil
 import stat
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from copy import deepcopy
+from functools import lru_cache
 
 import numpy
 import progressbar
@@ -12,6 +16,11 @@ import compass.namelist
 import compass.streams
 from compass.io import download, package_path, symlink
 
+# namelist replacement files are package resources, which do not change while
+# compass is running, so each only needs to be parsed once
+_parse_replacements_cached = lru_cache(maxsize=None)(
+    compass.namelist.parse_replacements)
+
 
 class Step:
     """
@@ -135,12 +144,18 @@ class Step:
         subprocess if there is not a good way to redirect output to a log
         file (e.g. if the step calls external code that, in turn, calls
         additional subprocesses).
+
+    parallel_group : str
+        The name of a group of steps that can run at the same time as one
+        another.  Consecutive steps in ``steps_to_run`` with the same
+        ``parallel_group`` are run concurrently, each as a subprocess.  The
+        default, ``None``, means the step runs on its own.
     """
 
     def __init__(self, test_case, name, subdir=None, cpus_per_task=1,
                  min_cpus_per_task=1, ntasks=1, min_tasks=1,
                  openmp_threads=1, max_memory=None, cached=False,
-                 run_as_subprocess=False):
+                 run_as_subprocess=False, parallel_group=None):
         """
         Create a new test case
 
@@ -194,6 +209,11 @@ class Step:
             subprocess if there is not a good way to redirect output to a log
             file (e.g. if the step calls external code that, in turn, calls
             additional subprocesses).
+
+        parallel_group : str, optional
+            The name of a group of steps that can run at the same time as one
+            another.  Steps in a group must not depend on each other's
+            outputs
         """
         self.name = name
         self.test_case = test_case
@@ -215,6 +235,7 @@ class Step:
                                  test_case.subdir, self.subdir)
 
         self.run_as_subprocess = run_as_subprocess
+        self.parallel_group = parallel_group
 
         # child steps (or test cases) will add to these
         self.input_data = list()
@@ -677,6 +698,8 @@ class Step:
                     database='compass_cache')
 
         inputs = []
+        resolved = []
+        downloads = dict()
         databases_with_downloads = set()
         for entry in self.input_data:
             filename = entry['filename']
@@ -758,10 +781,18 @@ class Step:
                 download_path = download_target
 
             if url is not None:
-                download_target = download(url, download_path, config)
-                if target is not None:
-                    # this is the absolute path that we presumably want
-                    target = download_target
+                downloads[(url, download_path)] = None
+
+            resolved.append((filename, target, url, download_path, copy))
+
+        # the downloads are independent and I/O-bound, so do them
+        # concurrently
+        self._download_files(downloads)
+
+        for filename, target, url, download_path, copy in resolved:
+            if url is not None and target is not None:
+                # this is the absolute path that we presumably want
+                target = downloads[(url, download_path)]
 
             if target is not None:
                 filepath = os.path.join(step_dir, filename)
@@ -776,16 +807,63 @@ class Step:
         if len(databases_with_downloads) > 0:
             self._fix_permissions(databases_with_downloads)
 
-        # convert inputs and outputs to absolute paths
-        self.inputs = [os.path.abspath(os.path.join(step_dir, filename)) for
-                       filename in inputs]
+        # convert inputs and outputs to absolute paths, finding the absolute
+        # path of the step directory only once
+        step_dir_abs = os.path.abspath(step_dir)
+        self.inputs = [os.path.normpath(os.path.join(step_dir_abs, filename))
+                       for filename in inputs]
 
-        self.outputs = [os.path.abspath(os.path.join(step_dir, filename)) for
-                        filename in self.outputs]
+        self.outputs = [os.path.normpath(os.path.join(step_dir_abs, filename))
+                        for filename in self.outputs]
 
         self._generate_namelists()
         self._generate_streams()
 
+    def _download_files(self, downloads):
+        """
+        Download files from their URLs, using a pool of threads if more than
+        one file is requested and the ``max_parallel`` config option in the
+        ``download`` section allows it
+
+        Parameters
+        ----------
+        downloads : dict
+            A dictionary with ``(url, download_path)`` tuples as keys.  The
+            values are replaced by the resulting paths of the downloaded files
+        """
+        config = self.config
+        if len(downloads) == 0:
+            return
+
+        max_parallel = config.getint('download', 'max_parallel')
+        max_workers = max(1, min(max_parallel, len(downloads)))
+
+        if max_workers == 1:
+            for url, download_path in downloads:
+                downloads[(url, download_path)] = download(
+                    url, download_path, config)
+            return
+
+        # progress bars from concurrent downloads would garble one another
+        cancel_event = threading.Event()
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            futures = dict()
+            for url, download_path in downloads:
+                future = executor.submit(download, url, download_path, config,
+                                         show_progress=False,
+                                         cancel_event=cancel_event)
+                futures[future] = (url, download_path)
+            for future in as_completed(futures):
+                downloads[futures[future]] = future.result()
+        except BaseException:
+            # a download failed or the user interrupted setup, so stop the
+            # other downloads rather than waiting for them to finish
+            cancel_event.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        executor.shutdown()
+
     def _generate_namelists(self):
         """
         Writes out a namelist file in the work directory with new values given
@@ -814,8 +892,8 @@ class Step:
                     # this is a dictionary of replacement namelist options
                     options = entry['options']
                 else:
-                    options = compass.namelist.parse_replacements(
-                        entry['package'], entry['namelist'])
+                    options = deepcopy(_parse_replacements_cached(
+                        entry['package'], entry['namelist']))
                 replacements.update(options)
 
             defaults_filename = config.get('namelists', mode)
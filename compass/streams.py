@@ -1,5 +1,6 @@
 from lxml import etree
 from copy import deepcopy
+from functools import lru_cache
 from importlib import resources
 from jinja2 import Template
 
@@ -30,9 +31,9 @@ def read(package, streams_filename, tree=None, replacements=None):
         the given streams file
     """
     if replacements is None:
-        text = resources.read_text(package, streams_filename)
+        text = _read_text(package, streams_filename)
     else:
-        template = Template(resources.read_text(package, streams_filename))
+        template = _read_template(package, streams_filename)
         text = template.render(**replacements)
 
     new_tree = etree.fromstring(text)
@@ -45,58 +46,62 @@ def read(package, streams_filename, tree=None, replacements=None):
 def write(streams, out_filename):
     """ write the streams XML data to the file """
 
-    with open(out_filename, 'w') as stream_file:
+    text = list()
+
+    text.append('<streams>\n')
 
-        stream_file.write('<streams>\n')
+    # Write out all immutable streams first
+    for stream in streams.findall('immutable_stream'):
+        stream_name = stream.attrib['name']
 
-        # Write out all immutable streams first
-        for stream in streams.findall('immutable_stream'):
-            stream_name = stream.attrib['name']
+        text.append('\n')
+        text.append('<immutable_stream name="{}"'.format(
+            stream_name))
+        # Process all attributes on the stream
+        for attr, val in stream.attrib.items():
+            if attr.strip() != 'name':
+                text.append('\n                  {}="{}"'.format(
+                    attr, val))
 
-            stream_file.write('\n')
-            stream_file.write('<immutable_stream name="{}"'.format(
-                stream_name))
-            # Process all attributes on the stream
-            for attr, val in stream.attrib.items():
-                if attr.strip() != 'name':
-                    stream_file.write('\n                  {}="{}"'.format(
-                        attr, val))
+        text.append('/>\n')
 
-            stream_file.write('/>\n')
+    # Write out all immutable streams
+    for stream in streams.findall('stream'):
+        stream_name = stream.attrib['name']
 
-        # Write out all immutable streams
-        for stream in streams.findall('stream'):
-            stream_name = stream.attrib['name']
+        text.append('\n')
+        text.append('<stream name="{}"'.format(stream_name))
 
-            stream_file.write('\n')
-            stream_file.write('<stream name="{}"'.format(stream_name))
+        # Process all attributes
+        for attr, val in stream.attrib.items():
+            if attr.strip() != 'name':
+                text.append('\n        {}="{}"'.format(attr, val))
 
-            # Process all attributes
-            for attr, val in stream.attrib.items():
-                if attr.strip() != 'name':
-                    stream_file.write('\n        {}="{}"'.format(attr, val))
+        text.append('>\n\n')
 
-            stream_file.write('>\n\n')
+        # Write out all contents of the stream
+        for tag in ['stream', 'var_struct', 'var_array', 'var']:
+            for child in stream.findall(tag):
+                child_name = child.attrib['name']
+                if tag == 'stream' and child_name == stream_name:
+                    # don't include the stream itself
+                    continue
+                if 'packages' in child.attrib.keys():
+                    package_name = child.attrib['packages']
+                    entry = '    <{} name="{}" packages="{}"/>\n' \
+                            ''.format(tag, child_name, package_name)
+                else:
+                    entry = '    <{} name="{}"/>\n'.format(tag, child_name)
+                text.append(entry)
 
-            # Write out all contents of the stream
-            for tag in ['stream', 'var_struct', 'var_array', 'var']:
-                for child in stream.findall(tag):
-                    child_name = child.attrib['name']
-                    if tag == 'stream' and child_name == stream_name:
-                        # don't include the stream itself
-                        continue
-                    if 'packages' in child.attrib.keys():
-                        package_name = child.attrib['packages']
-                        entry = '    <{} name="{}" packages="{}"/>\n' \
-                                ''.format(tag, child_name, package_name)
-                    else:
-                        entry = '    <{} name="{}"/>\n'.format(tag, child_name)
-                    stream_file.write(entry)
+        text.append('</stream>\n')
 
-            stream_file.write('</stream>\n')
+    text.append('\n')
+    text.append('</streams>\n')
 
-        stream_file.write('\n')
-        stream_file.write('</streams>\n')
+    # write the whole file at once
+    with open(out_filename, 'w') as stream_file:
+        stream_file.write(''.join(text))
 
 
 def update_defaults(new_child, defaults):
@@ -135,6 +140,20 @@ def update_defaults(new_child, defaults):
         defaults.append(deepcopy(new_child))
 
 
+# streams files are package resources, which do not change while compass is
+# running, so each only needs to be read (and compiled as a template) once
+@lru_cache(maxsize=None)
+def _read_text(package, streams_filename):
+    """ Read the contents of a streams file from a package """
+    return resources.read_text(package, streams_filename)
+
+
+@lru_cache(maxsize=None)
+def _read_template(package, streams_filename):
+    """ Read a streams file from a package as a Jinja2 template """
+    return Template(_read_text(package, streams_filename))
+
+
 def _update_tree(tree, new_tree):
 
     if tree is None:
@@ -1,20 +1,8 @@
 #!/usr/bin/env python
-from __future__ import print_function
-
 import argparse
 import os
 import shutil
-
-try:
-    from configparser import ConfigParser
-except ImportError:
-    import six
-    from six.moves import configparser
-
-    if six.PY2:
-        ConfigParser = configparser.SafeConfigParser
-    else:
-        ConfigParser = configparser.ConfigParser
+from configparser import ConfigParser
 
 from shared import check_call, get_logger
 